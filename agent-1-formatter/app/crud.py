@@ -1,3 +1,4 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from . import models, schemas
 
@@ -164,3 +165,54 @@ def save_ground_truth(
     )
 
     db.commit()
+
+
+def get_tickets_summary(db: Session, top_n: int = 5):
+    """
+    Aggregate ticket statistics and top spenders/categories in the database.
+
+    Args:
+        db (Session): The database session.
+        top_n (int): The number of top users and categories to return.
+    Returns:
+        dict: Ticket counts, total amount spent and the top users and categories by amount spent.
+    """
+    amount = func.coalesce(models.Ticket.total_amount, 0.0)
+
+    total_tickets, approved_tickets, needs_review, total_spent = db.query(
+        func.count(models.Ticket.id),
+        func.count(models.Ticket.id).filter(models.Ticket.approved.is_(True)),
+        func.count(models.Ticket.id).filter(models.Ticket.need_verify.is_(True)),
+        func.coalesce(func.sum(amount), 0.0)
+    ).one()
+
+    user_id = func.coalesce(models.Ticket.user_id, "Unknown").label("user_id")
+    user_spent = func.sum(amount).label("total_amount")
+    top_users = (
+        db.query(user_id, user_spent)
+        .group_by(user_id)
+        .order_by(user_spent.desc())
+        .limit(top_n)
+        .all()
+    )
+
+    category = func.coalesce(models.Ticket.category, "Uncategorized").label("category")
+    category_spent = func.sum(amount).label("total_amount")
+    top_categories = (
+        db.query(category, category_spent)
+        .group_by(category)
+        .order_by(category_spent.desc())
+        .limit(top_n)
+        .all()
+    )
+
+    return {
+        "total_tickets": total_tickets,
+        "approved_tickets": approved_tickets,
+        "needs_review": needs_review,
+        "total_spent": float(total_spent),
+        "top_users": [{"user_id": row.user_id, "total_amount": float(row.total_amount)} for row in top_users],
+        "top_categories": [
+            {"category": row.category, "total_amount": float(row.total_amount)} for row in top_categories
+        ]
+    }
@@ -381,3 +381,27 @@ def get_all_tickets(
     except Exception as e:
         logger.error(f"Error fetching all tickets: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching tickets: {str(e)}")
+
+
+@app.get("/api/tickets/summary")
+def get_tickets_summary(
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_current_user)
+):
+    """
+    Get aggregated ticket statistics for the admin dashboard.
+    Counts and totals are computed in the database instead of shipping every ticket to the client.
+
+    Args:
+        db (Session): The database session.
+        user_id (str): The ID of the authenticated user.
+    Returns:
+        dict: Ticket counts, total amount spent and the top 5 users and categories by amount spent.
+    Raises:
+        HTTPException: If computing the summary fails.
+    """
+    try:
+        return crud.get_tickets_summary(db=db)
+    except Exception as e:
+        logger.error(f"Error computing tickets summary: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error computing tickets summary: {str(e)}")
@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 import uuid
@@ -58,6 +60,14 @@ class EvaluationResultResponse(BaseModel):
         from_attributes = True
 
 
+SCORE_FIELDS = {"faithfulness_score", "answer_relevance_score", "context_precision_score", "context_recall_score"}
+
+
+def safe_score(value):
+    """Convert a stored Numeric score to float, treating missing and zero scores as None"""
+    return float(value) if value else None
+
+
 class TriggerResponse(BaseModel):
     message: str
     run_id: Optional[str] = None
@@ -198,13 +208,21 @@ async def get_evaluation_run(
 @router.get("/runs/{run_id}/results", response_model=List[EvaluationResultResponse])
 async def get_evaluation_results(
     run_id: str,
+    fields: Optional[str] = Query(None, description="Comma-separated result fields to return (default: all)"),
     db: Session = Depends(get_db)
 ):
     """
     Get detailed results for a specific evaluation run
 
     - **run_id**: UUID of the evaluation run
+    - **fields**: Comma-separated subset of result fields to return, e.g. `query_text,faithfulness_score`
     """
+    selected_fields = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+    if selected_fields:
+        unknown_fields = set(selected_fields) - set(EvaluationResultResponse.model_fields)
+        if unknown_fields:
+            raise HTTPException(status_code=400, detail=f"Unknown result fields: {', '.join(sorted(unknown_fields))}")
+
     try:
         eval_db = EvaluationDB(db)
         run_uuid = uuid.UUID(run_id)
@@ -215,7 +233,17 @@ async def get_evaluation_results(
             raise HTTPException(status_code=404, detail="Evaluation run not found")
 
         # Get results
-        results = eval_db.get_evaluation_results(run_uuid)
+        results = eval_db.get_evaluation_results(run_uuid, columns=selected_fields)
+
+        if selected_fields:
+            # Projected rows don't match the full response model, so they are returned as plain JSON
+            return JSONResponse(jsonable_encoder([
+                {
+                    field: safe_score(getattr(result, field)) if field in SCORE_FIELDS else getattr(result, field)
+                    for field in selected_fields
+                }
+                for result in results
+            ]))
 
         return [
             EvaluationResultResponse(
@@ -225,10 +253,10 @@ async def get_evaluation_results(
                 generated_answer=result.generated_answer,
                 retrieved_context=result.retrieved_context,
                 reference_answer=result.reference_answer,
-                faithfulness_score=float(result.faithfulness_score) if result.faithfulness_score else None,
-                answer_relevance_score=float(result.answer_relevance_score) if result.answer_relevance_score else None,
-                context_precision_score=float(result.context_precision_score) if result.context_precision_score else None,
-                context_recall_score=float(result.context_recall_score) if result.context_recall_score else None,
+                faithfulness_score=safe_score(result.faithfulness_score),
+                answer_relevance_score=safe_score(result.answer_relevance_score),
+                context_precision_score=safe_score(result.context_precision_score),
+                context_recall_score=safe_score(result.context_recall_score),
                 response_time_ms=result.response_time_ms,
                 token_count=result.token_count,
                 evaluation_status=result.evaluation_status,
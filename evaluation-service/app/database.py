@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, Numeric, ForeignKey, Date
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session, relationship
+from sqlalchemy.orm import sessionmaker, Session, relationship, load_only
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
 from typing import Optional, List
@@ -259,8 +259,12 @@ class EvaluationDB:
     def get_evaluation_run(self, run_id: uuid.UUID) -> Optional[EvaluationRun]:
         return self.db.query(EvaluationRun).filter(EvaluationRun.run_id == run_id).first()
 
-    def get_evaluation_results(self, run_id: uuid.UUID) -> List[EvaluationResult]:
-        return self.db.query(EvaluationResult).filter(EvaluationResult.run_id == run_id).all()
+    def get_evaluation_results(self, run_id: uuid.UUID, columns: Optional[List[str]] = None) -> List[EvaluationResult]:
+        query = self.db.query(EvaluationResult).filter(EvaluationResult.run_id == run_id)
+        if columns:
+            # Only load the requested columns, skipping large text fields nobody asked for
+            query = query.options(load_only(*[getattr(EvaluationResult, column) for column in columns]))
+        return query.order_by(EvaluationResult.id).all()
 
     def get_latest_metrics(self) -> Optional[EvaluationRun]:
         return self.db.query(EvaluationRun).filter(EvaluationRun.status == "completed").order_by(EvaluationRun.completed_at.desc()).first()
@@ -2,6 +2,7 @@ import logging
 import os
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from opentelemetry import trace
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
@@ -38,6 +39,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (runs, results, trends) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 def setup_tracing():
     """Setup OpenTelemetry tracing"""
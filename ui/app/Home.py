@@ -289,8 +289,9 @@ else:
         # Extract roles from the custom claim
         user_roles = payload.get(f'{namespace}/roles', [])
 
-        # Store roles in the session state
+        # Store roles in the session state, plus a set for the pages' access checks
         st.session_state['roles'] = user_roles
+        st.session_state['role_set'] = frozenset(user_roles)
 
     except jwt.PyJWTError as e:
         user_name = "User"
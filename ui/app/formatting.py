@@ -0,0 +1,26 @@
+"""
+Display formatting helpers shared by the UI pages.
+"""
+from datetime import datetime
+from functools import lru_cache
+
+import pandas as pd
+
+
+# Pages are re-executed on every rerun, so the cache lives here where it survives across reruns
+@lru_cache(maxsize=1024)
+def format_timestamp(timestamp_str):
+    """Format timestamp for display"""
+    if not timestamp_str:
+        return "N/A"
+    try:
+        dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except:
+        return timestamp_str
+
+
+def format_timestamps(series):
+    """Format a column of ISO timestamps for display in one vectorized pass"""
+    timestamps = pd.to_datetime(series, format="ISO8601", utc=True, errors="coerce")
+    return timestamps.dt.strftime("%Y-%m-%d %H:%M:%S").fillna("N/A")
@@ -1,86 +1,15 @@
 """
 Admin Dashboard Page, with Chatbot, Ticket Review & Correction, and Database Viewer.
 """
+import math
 import requests
+from requests.adapters import HTTPAdapter
 import streamlit as st
 from datetime import date
 
-st.set_page_config(page_title="Admin Dashboard", layout="wide")
+from styles import apply_sidebar_style
 
-# Apply consistent blue sidebar styling
-st.markdown("""
-<style>
-    /* Sidebar styling */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #1e3a8a 0%, #3b82f6 100%);
-    }
-
-    [data-testid="stSidebar"] * {
-        color: white !important;
-    }
-
-    /* Sidebar buttons - make them visible with background */
-    [data-testid="stSidebar"] button {
-        background-color: rgba(255, 255, 255, 0.2) !important;
-        border: 1px solid rgba(255, 255, 255, 0.3) !important;
-        color: white !important;
-        font-weight: 500 !important;
-        transition: all 0.3s ease !important;
-    }
-
-    [data-testid="stSidebar"] button:hover {
-        background-color: rgba(255, 255, 255, 0.3) !important;
-        border-color: rgba(255, 255, 255, 0.5) !important;
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2) !important;
-    }
-
-    [data-testid="stSidebar"] button p {
-        color: white !important;
-    }
-
-    /* Sidebar selectbox - make them visible */
-    [data-testid="stSidebar"] [data-baseweb="select"] {
-        background-color: rgba(255, 255, 255, 0.2) !important;
-        border: 1px solid rgba(255, 255, 255, 0.3) !important;
-    }
-
-    [data-testid="stSidebar"] [data-baseweb="select"] > div {
-        background-color: transparent !important;
-        color: white !important;
-    }
-
-    /* Sidebar slider */
-    [data-testid="stSidebar"] [data-testid="stSlider"] {
-        background-color: rgba(255, 255, 255, 0.1) !important;
-        padding: 0.5rem;
-        border-radius: 0.5rem;
-    }
-
-    /* Make selectbox options readable */
-    [data-baseweb="popover"] {
-        background-color: white !important;
-    }
-
-    [data-baseweb="popover"] * {
-        color: #1f2937 !important;
-    }
-
-    /* Fix main content buttons - ensure text is visible */
-    div[data-testid="stMainBlockContainer"] button {
-        color: #1f2937 !important;
-    }
-
-    div[data-testid="stMainBlockContainer"] button:hover {
-        color: #111827 !important;
-    }
-
-    /* Ensure button text in main area is dark */
-    div[data-testid="stMainBlockContainer"] .stButton > button p {
-        color: #1f2937 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.set_page_config(page_title="Admin Dashboard", layout="wide")
 
 # --- Security Guard ---
 # Check if the user is logged in
@@ -88,12 +17,49 @@ if 'token' not in st.session_state:
     st.warning("Please log in to access this page.")
     st.stop()
 
-# Check for the correct role to access the page
-user_roles = st.session_state.get('roles', [])
-if 'admin' not in user_roles:
+# Check for the correct role to access the page; sessions from before role_set existed only have roles
+role_set = st.session_state.get('role_set') or frozenset(st.session_state.get('roles', ()))
+if 'admin' not in role_set:
     st.error("🚫 You do not have permission to view this page. This area is for administrators only.")
     st.stop()
 
+# Apply consistent blue sidebar styling, only once the user is allowed to see the page
+apply_sidebar_style()
+
+# --- Backend Calls ---
+
+@st.cache_resource
+def get_session():
+    """Shared HTTP session, so backend calls reuse pooled keep-alive connections across reruns"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+    return session
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_tickets_summary(id_token):
+    """Fetch ticket statistics aggregated in the database by Agent 1"""
+    response = get_session().get(
+        "http://agent-1-formatter:8000/api/tickets/summary",
+        headers={"Authorization": f"Bearer {id_token}"},
+        timeout=10
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def get_receipt_bytes(s3_path):
+    """Fetch a receipt image from Agent 1, cached by s3_path since uploaded receipts never change"""
+    response = get_session().get(
+        "http://agent-1-formatter:8000/api/image",
+        params={"s3_path": s3_path},
+        timeout=5
+    )
+    response.raise_for_status()
+    return response.content
+
+
 # --- Page Content ---
 st.title("Admin Dashboard 📈")
 tab1, tab2, tab3 = st.tabs(["💬 LLM Chat", "📝 Ticket Review & Correction", "🗄️ Database Viewer"])
@@ -130,7 +96,7 @@ with tab1:
                 agent_2_url = "http://agent-2-rag:8000/ask"
                 headers = {"Authorization": f"Bearer {id_token}"}
                 try:
-                    response = requests.post(agent_2_url, json={"query": question}, headers=headers)
+                    response = get_session().post(agent_2_url, json={"query": question}, headers=headers)
                     if response.status_code == 200:
                         answer = response.json().get('answer')
                         st.success(f"**Answer:** {answer}")
@@ -142,7 +108,7 @@ with tab1:
 
                             with st.spinner("Evaluating query quality with RAGAS metrics..."):
                                 try:
-                                    eval_response = requests.post(
+                                    eval_response = get_session().post(
                                         "http://evaluation-service:8006/api/v1/evaluation/realtime",
                                         json={
                                             "question": question,
@@ -234,7 +200,7 @@ with tab2:
             id_token = st.session_state['token']['id_token']
 
             # Fetch recent tickets from database
-            tickets_response = requests.get(
+            tickets_response = get_session().get(
                 "http://agent-1-formatter:8000/api/tickets",  # Assuming this endpoint exists
                 headers={"Authorization": f"Bearer {id_token}"},
                 params={"limit": 10, "need_verify": True}
@@ -274,8 +240,10 @@ with tab2:
                         # Show receipt image from MinIO
                         s3_path = selected_ticket.get('s3_path')
                         if s3_path:
-                            image_api_url = f"http://localhost:8002/api/image?s3_path={s3_path}"
-                            st.image(image_api_url, caption="Receipt Image", use_container_width=True)
+                            try:
+                                st.image(get_receipt_bytes(s3_path), caption="Receipt Image", use_container_width=True)
+                            except Exception:
+                                st.info("📷 Image preview unavailable")
                         else:
                             st.info("No image available for this ticket.")
 
@@ -349,7 +317,7 @@ with tab2:
                     if submit_eval:
                         with st.spinner("Evaluating OCR quality..."):
                             try:
-                                eval_response = requests.post(
+                                eval_response = get_session().post(
                                     "http://evaluation-service:8006/api/v1/evaluation/agent1/realtime",
                                     json={
                                         "ticket_id": selected_ticket_id,
@@ -447,7 +415,7 @@ with tab2:
 
                                     # Save ground truth and auto-approve
                                     try:
-                                        save_gt_response = requests.post(
+                                        save_gt_response = get_session().post(
                                             "http://agent-1-formatter:8000/api/save-ground-truth",
                                             headers={"Authorization": f"Bearer {id_token}"},
                                             json={
@@ -494,7 +462,7 @@ with tab3:
 
         # Fetch all tickets from database
         with st.spinner("Loading tickets from database..."):
-            all_tickets_response = requests.get(
+            all_tickets_response = get_session().get(
                 "http://agent-1-formatter:8000/api/tickets/all",
                 headers={"Authorization": f"Bearer {id_token}"}
             )
@@ -506,59 +474,46 @@ with tab3:
                 # === STATISTICS SECTION ===
                 st.markdown("### 📊 Overall Statistics")
 
-                # Calculate statistics
-                total_tickets = len(all_tickets)
-                approved_tickets = sum(1 for t in all_tickets if t.get('approved'))
-                needs_review = sum(1 for t in all_tickets if t.get('need_verify'))
-                total_spent = sum(float(t.get('total_amount', 0)) for t in all_tickets)
-
-                # Display metrics
-                metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
-                with metric_col1:
-                    st.metric("📝 Total Tickets", total_tickets)
-                with metric_col2:
-                    st.metric("✅ Approved", approved_tickets)
-                with metric_col3:
-                    st.metric("⚠️ Needs Review", needs_review)
-                with metric_col4:
-                    st.metric("💰 Total Spent", f"${total_spent:,.2f}")
-
-                st.markdown("---")
-
-                # === TRENDS SECTION ===
-                st.markdown("### 📈 Spending Trends")
-
-                trend_col1, trend_col2 = st.columns(2)
-
-                with trend_col1:
-                    # Top spending users
-                    st.markdown("#### 👤 Top Spenders")
-                    user_spending = {}
-                    for ticket in all_tickets:
-                        user_id = ticket.get('user_id', 'Unknown')
-                        amount = float(ticket.get('total_amount', 0))
-                        user_spending[user_id] = user_spending.get(user_id, 0) + amount
-
-                    # Sort and display top 5
-                    top_users = sorted(user_spending.items(), key=lambda x: x[1], reverse=True)[:5]
-                    for idx, (user, amount) in enumerate(top_users, 1):
-                        # Shorten user ID for display
-                        display_user = user[:20] + "..." if len(user) > 20 else user
-                        st.write(f"{idx}. **{display_user}**: ${amount:,.2f}")
-
-                with trend_col2:
-                    # Top spending categories
-                    st.markdown("#### 🏷️ Top Categories")
-                    category_spending = {}
-                    for ticket in all_tickets:
-                        category = ticket.get('category', 'Uncategorized')
-                        amount = float(ticket.get('total_amount', 0))
-                        category_spending[category] = category_spending.get(category, 0) + amount
-
-                    # Sort and display top 5
-                    top_categories = sorted(category_spending.items(), key=lambda x: x[1], reverse=True)[:5]
-                    for idx, (cat, amount) in enumerate(top_categories, 1):
-                        st.write(f"{idx}. **{cat}**: ${amount:,.2f}")
+                # Statistics are aggregated by the backend
+                try:
+                    summary = fetch_tickets_summary(id_token)
+                except Exception as e:
+                    summary = None
+                    st.warning(f"Could not load ticket statistics: {str(e)}")
+
+                if summary:
+                    # Display metrics
+                    metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
+                    with metric_col1:
+                        st.metric("📝 Total Tickets", summary['total_tickets'])
+                    with metric_col2:
+                        st.metric("✅ Approved", summary['approved_tickets'])
+                    with metric_col3:
+                        st.metric("⚠️ Needs Review", summary['needs_review'])
+                    with metric_col4:
+                        st.metric("💰 Total Spent", f"${summary['total_spent']:,.2f}")
+
+                    st.markdown("---")
+
+                    # === TRENDS SECTION ===
+                    st.markdown("### 📈 Spending Trends")
+
+                    trend_col1, trend_col2 = st.columns(2)
+
+                    with trend_col1:
+                        # Top spending users
+                        st.markdown("#### 👤 Top Spenders")
+                        for idx, top_user in enumerate(summary['top_users'], 1):
+                            # Shorten user ID for display
+                            user = top_user['user_id']
+                            display_user = user[:20] + "..." if len(user) > 20 else user
+                            st.write(f"{idx}. **{display_user}**: ${top_user['total_amount']:,.2f}")
+
+                    with trend_col2:
+                        # Top spending categories
+                        st.markdown("#### 🏷️ Top Categories")
+                        for idx, top_category in enumerate(summary['top_categories'], 1):
+                            st.write(f"{idx}. **{top_category['category']}**: ${top_category['total_amount']:,.2f}")
 
                 st.markdown("---")
 
@@ -584,8 +539,10 @@ with tab3:
                 with filter_col3:
                     # Get unique users
                     users = sorted(set(t.get('user_id', 'Unknown') for t in all_tickets))
-                    user_display = ["All"] + [u[:30] + "..." if len(u) > 30 else u for u in users]
-                    user_filter = st.selectbox("User", user_display)
+                    # Map each shortened display name back to its user ID (None means no user filter)
+                    display_to_user = {"All": None}
+                    display_to_user.update({(u[:30] + "..." if len(u) > 30 else u): u for u in users})
+                    user_filter = st.selectbox("User", list(display_to_user))
 
                 # Apply filters
                 filtered_tickets = all_tickets.copy()
@@ -600,11 +557,9 @@ with tab3:
                 if category_filter != "All":
                     filtered_tickets = [t for t in filtered_tickets if t.get('category') == category_filter]
 
-                if user_filter != "All":
-                    # Find the actual user ID from the display name
-                    actual_user = users[user_display.index(user_filter) - 1] if user_filter != "All" else None
-                    if actual_user:
-                        filtered_tickets = [t for t in filtered_tickets if t.get('user_id') == actual_user]
+                actual_user = display_to_user[user_filter]
+                if actual_user:
+                    filtered_tickets = [t for t in filtered_tickets if t.get('user_id') == actual_user]
 
                 st.markdown(f"### 📋 Tickets ({len(filtered_tickets)} results)")
 
@@ -613,8 +568,17 @@ with tab3:
                     # Sort by ID descending (most recent first)
                     filtered_tickets = sorted(filtered_tickets, key=lambda x: x.get('id', 0), reverse=True)
 
+                    # Paginate so only one page of expanders is built per render
+                    page_col1, page_col2 = st.columns(2)
+                    with page_col1:
+                        page_size = st.selectbox("Tickets per page", [25, 50, 100])
+                    total_pages = max(1, math.ceil(len(filtered_tickets) / page_size))
+                    with page_col2:
+                        page = st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1, step=1)
+                    page_tickets = filtered_tickets[(page - 1) * page_size:page * page_size]
+
                     # Display tickets in expandable sections
-                    for ticket in filtered_tickets:
+                    for ticket in page_tickets:
                         ticket_id = ticket.get('id', 'N/A')
                         merchant = ticket.get('merchant_name', 'Unknown')
                         amount = ticket.get('total_amount', 0)
@@ -664,14 +628,16 @@ with tab3:
                                     st.write("_No items_")
 
                             with ticket_col2:
-                                # Display receipt image from MinIO
+                                # Display receipt image from MinIO, only once the admin asks for it
                                 s3_path = ticket.get('s3_path')
                                 if s3_path:
-                                    try:
-                                        image_api_url = f"http://localhost:8002/api/image?s3_path={s3_path}"
-                                        st.image(image_api_url, caption="Receipt Image", use_container_width=True)
-                                    except:
-                                        st.info("📷 Image preview unavailable")
+                                    image_loaded_key = f"img_loaded_{ticket_id}"
+                                    if st.session_state.get(image_loaded_key) or st.button("📷 Show receipt", key=f"img_{ticket_id}"):
+                                        st.session_state[image_loaded_key] = True
+                                        try:
+                                            st.image(get_receipt_bytes(s3_path), caption="Receipt Image", use_container_width=True)
+                                        except:
+                                            st.info("📷 Image preview unavailable")
                                 else:
                                     st.info("📷 No image available for this ticket")
 
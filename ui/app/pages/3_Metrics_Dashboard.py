@@ -1,153 +1,455 @@
 """
 Metrics Dashboard Page, with metrics and visualizations for both Agent 1 (OCR) and Agent 2 (RAG) evaluations.
 """
+import math
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
-import json
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import orjson
+
+from formatting import format_timestamp, format_timestamps
+from scoring import SCORE_BANDS, interpret_score
+from styles import apply_sidebar_style
 
 # Set page configuration
 st.set_page_config(page_title="Metrics Dashboard", layout="wide")
 
-# Apply consistent blue sidebar styling
-st.markdown("""
-<style>
-    /* Sidebar styling */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #1e3a8a 0%, #3b82f6 100%);
-    }
-
-    [data-testid="stSidebar"] * {
-        color: white !important;
-    }
-
-    /* Sidebar buttons - make them visible with background */
-    [data-testid="stSidebar"] button {
-        background-color: rgba(255, 255, 255, 0.2) !important;
-        border: 1px solid rgba(255, 255, 255, 0.3) !important;
-        color: white !important;
-        font-weight: 500 !important;
-        transition: all 0.3s ease !important;
-    }
-
-    [data-testid="stSidebar"] button:hover {
-        background-color: rgba(255, 255, 255, 0.3) !important;
-        border-color: rgba(255, 255, 255, 0.5) !important;
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2) !important;
-    }
-
-    [data-testid="stSidebar"] button p {
-        color: white !important;
-    }
-
-    /* Sidebar selectbox - make them visible */
-    [data-testid="stSidebar"] [data-baseweb="select"] {
-        background-color: rgba(255, 255, 255, 0.2) !important;
-        border: 1px solid rgba(255, 255, 255, 0.3) !important;
-    }
-
-    [data-testid="stSidebar"] [data-baseweb="select"] > div {
-        background-color: transparent !important;
-        color: white !important;
-    }
-
-    /* Sidebar slider */
-    [data-testid="stSidebar"] [data-testid="stSlider"] {
-        background-color: rgba(255, 255, 255, 0.1) !important;
-        padding: 0.5rem;
-        border-radius: 0.5rem;
-    }
-
-    /* Make selectbox options readable */
-    [data-baseweb="popover"] {
-        background-color: white !important;
-    }
-
-    [data-baseweb="popover"] * {
-        color: #1f2937 !important;
-    }
-
-    /* Fix main content buttons - ensure text is visible */
-    div[data-testid="stMainBlockContainer"] button {
-        color: #1f2937 !important;
-    }
-
-    div[data-testid="stMainBlockContainer"] button:hover {
-        color: #111827 !important;
-    }
-
-    /* Ensure button text in main area is dark */
-    div[data-testid="stMainBlockContainer"] .stButton > button p {
-        color: #1f2937 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
-
 # --- Security Guard ---
 # Check if the user is logged in
 if 'token' not in st.session_state:
     st.warning("Please log in to access this page.")
     st.stop()
 
-# Check for the correct role to access the page
-user_roles = st.session_state.get('roles', [])
-if 'admin' not in user_roles:
+# Check for the correct role to access the page; sessions from before role_set existed only have roles
+role_set = st.session_state.get('role_set') or frozenset(st.session_state.get('roles', ()))
+if 'admin' not in role_set:
     st.error("🚫 You do not have permission to view this page. This area is for administrators only.")
     st.stop()
 
+# Apply consistent blue sidebar styling, only once the user is allowed to see the page
+apply_sidebar_style()
+
 # Constants
 EVALUATION_SERVICE_URL = "http://evaluation-service:8006"
+# (connect, read) timeouts: fail fast when the service is down, allow slow reads
+FETCH_TIMEOUT = (2, 10)
+TRIGGER_TIMEOUT = (2, 30)
+REFRESH_SECONDS = 30
+# Cached responses expire just before each auto-refresh tick, so every tick fetches fresh data
+CACHE_TTL_SECONDS = REFRESH_SECONDS - 5
+# Health and scheduler status should stay close to live, so they are only cached for a few seconds
+STATUS_TTL_SECONDS = 5
+STATUS_REFRESH_SECONDS = 10
+
+@st.cache_resource
+def get_session():
+    """Shared HTTP session, so backend calls reuse pooled keep-alive connections across reruns"""
+    # Retry connection failures and transient gateway errors with backoff; POSTs are not retried so an evaluation
+    # is never triggered twice, and read timeouts are not retried so FETCH_TIMEOUT bounds a hung endpoint
+    retries = Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET"])
+    )
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = "gzip"
+    session.mount("http://", HTTPAdapter(max_retries=retries, pool_connections=8, pool_maxsize=16))
+    return session
 
-def fetch_data(endpoint):
-    """Fetch data from evaluation service API"""
+def parse_json(response):
+    """Parse a response body, reporting a malformed body as a requests error like response.json() does"""
     try:
-        response = requests.get(f"{EVALUATION_SERVICE_URL}{endpoint}", timeout=10)
-        response.raise_for_status()
-        return response.json()
+        # Parse the raw bytes directly; orjson is several times faster than the stdlib parser behind .json()
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(f"Invalid JSON in response: {e}", response=response) from e
+
+def get_json(endpoint):
+    """Fetch JSON from evaluation service API"""
+    response = get_session().get(f"{EVALUATION_SERVICE_URL}{endpoint}", timeout=FETCH_TIMEOUT)
+    response.raise_for_status()
+    return parse_json(response)
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=64, show_spinner=False)
+def fetch_json(endpoint):
+    """Fetch JSON from evaluation service API, reusing the response across reruns until the next refresh"""
+    return get_json(endpoint)
+
+@st.cache_data(ttl=STATUS_TTL_SECONDS, show_spinner=False)
+def fetch_status_json(endpoint):
+    """Fetch a status endpoint of the evaluation service, reusing the response for only a few seconds"""
+    return get_json(endpoint)
+
+def fetch_data(endpoint, future=None, fetch=fetch_json):
+    """Fetch data from evaluation service API, or collect it from a prefetch started with prefetch_data"""
+    try:
+        return future.result() if future else fetch(endpoint)
     except requests.exceptions.RequestException as e:
         st.error(f"Failed to fetch data from {endpoint}: {str(e)}")
         return None
 
+def prefetch_data(*endpoints, fetch=fetch_json):
+    """Start fetching independent endpoints concurrently, returning a future per endpoint"""
+    # Worker threads share this run's context so the response cache behaves as on the script thread
+    pool = ThreadPoolExecutor(
+        max_workers=len(endpoints),
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    )
+    futures = {endpoint: pool.submit(fetch, endpoint) for endpoint in endpoints}
+    pool.shutdown(wait=False)
+    return futures
+
 def trigger_evaluation(run_type="sample", sample_size=5):
     """Trigger a new evaluation"""
     try:
         if run_type == "sample":
-            response = requests.post(
+            response = get_session().post(
                 f"{EVALUATION_SERVICE_URL}/api/v1/evaluation/sample?sample_size={sample_size}",
-                timeout=30
+                timeout=TRIGGER_TIMEOUT
             )
         else:  # full evaluation
-            response = requests.post(
+            response = get_session().post(
                 f"{EVALUATION_SERVICE_URL}/api/v1/evaluation/run",
                 json={"run_type": "manual"},  # Full evaluation uses "manual" type
-                timeout=30
+                timeout=TRIGGER_TIMEOUT
             )
         response.raise_for_status()
-        return response.json()
+        # Drop cached responses so the new run shows up on the next render
+        fetch_json.clear()
+        return parse_json(response)
     except requests.exceptions.RequestException as e:
         st.error(f"Failed to trigger evaluation: {str(e)}")
         return None
 
-def format_timestamp(timestamp_str):
-    """Format timestamp for display"""
-    if not timestamp_str:
-        return "N/A"
-    try:
-        dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except:
-        return timestamp_str
+@st.cache_data(max_entries=16, show_spinner=False)
+def runs_to_frame(runs):
+    """Build the evaluation runs frame once per runs payload, with parsed and display-formatted timestamps and success rates"""
+    df = pd.DataFrame(runs)
+    for column in ('started_at', 'completed_at'):
+        df[column] = pd.to_datetime(df[column], format="ISO8601", utc=True, errors="coerce")
+    df['_started_fmt'] = format_timestamps(df['started_at'])
+    df['_completed_fmt'] = format_timestamps(df['completed_at'])
+    for column in ('average_faithfulness', 'average_answer_relevance', 'average_context_precision', 'average_context_recall'):
+        df[column] = pd.to_numeric(df[column], errors='coerce', downcast='float')
+    # Runs without queries (or counts yet) get 0% straight from the masked division
+    successful = df['successful_queries'].to_numpy(dtype=float)
+    total = df['total_queries'].to_numpy(dtype=float)
+    df['success_rate'] = np.divide(successful, total, out=np.zeros(len(df)), where=(total > 0) & np.isfinite(successful)) * 100
+    return df
+
+# Agent 1 run fields the dashboard uses, with narrow dtypes; ticket counts may be missing on unfinished runs
+AGENT1_RUN_DTYPES = {
+    "run_id": "object",
+    "run_type": "category",
+    "status": "category",
+    "started_at": "object",
+    "total_tickets": "Int32",
+    "successful_tickets": "Int32",
+    "average_merchant_match": "float32",
+    "average_amount_match": "float32",
+    "average_item_f1": "float32",
+    "average_overall_quality": "float32",
+}
+
+# Agent 1 summary fields shown in the Detailed Metrics table: (category, label, summary key)
+AGENT1_DETAILED_METRICS = (
+    ("Exact Match", "📅 Date Match", "avg_date_match"),
+    ("Exact Match", "🏪 Merchant Match", "avg_merchant_match"),
+    ("Exact Match", "💰 Amount Match", "avg_amount_match"),
+    ("Item Extraction", "🎯 Precision", "avg_item_precision"),
+    ("Item Extraction", "📚 Recall", "avg_item_recall"),
+    ("Item Extraction", "⚖️ F1 Score", "avg_item_f1"),
+    ("LLM-as-a-Judge", "🔤 Merchant Similarity", "avg_merchant_similarity"),
+    ("LLM-as-a-Judge", "📝 Items Similarity", "avg_items_similarity"),
+    ("LLM-as-a-Judge", "⭐ Overall Quality", "avg_overall_quality"),
+)
+
+# Agent 1 runs table columns, in display order
+AGENT1_RUN_COLUMN_CONFIG = {
+    "_run_id_short": "Run ID",
+    "run_type": "Type",
+    "status": "Status",
+    "started_at": st.column_config.DatetimeColumn("Started", format="YYYY-MM-DD HH:mm:ss"),
+    "total_tickets": "Tickets",
+    "successful_tickets": "Success",
+    "_average_merchant_match_pct": st.column_config.NumberColumn("Merchant Match", format="%.1f%%"),
+    "_average_amount_match_pct": st.column_config.NumberColumn("Amount Match", format="%.1f%%"),
+    "_average_item_f1_pct": st.column_config.NumberColumn("F1 Score", format="%.1f%%"),
+    "_average_overall_quality_pct": st.column_config.NumberColumn("Overall Quality", format="%.1f%%"),
+}
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def agent1_runs_to_frame(runs):
+    """Build the Agent 1 evaluation runs frame once per runs payload, with parsed start times and table columns"""
+    df = pd.DataFrame(runs, columns=list(AGENT1_RUN_DTYPES)).astype(AGENT1_RUN_DTYPES)
+    df['started_at'] = pd.to_datetime(df['started_at'], format="ISO8601", utc=True, errors="coerce")
+    df['_run_id_short'] = df['run_id'].astype(str).str[:8]
+    for column in AGENT1_TREND_METRICS:
+        df[f"_{column}_pct"] = df[column] * 100
+    return df
+
+def score_column_config(columns):
+    """Column config showing score columns as numbers with 3 decimals, formatted by the grid per visible row"""
+    return {column: st.column_config.NumberColumn(format="%.3f") for column in columns}
+
+# Trend lines keep at most this many points per trace; longer histories are downsampled with LTTB
+MAX_TREND_POINTS = 500
+
+AGENT1_TREND_METRICS = {
+    "average_overall_quality": "Overall Quality",
+    "average_merchant_match": "Merchant Match",
+    "average_amount_match": "Amount Match",
+    "average_item_f1": "Item F1 Score",
+}
+
+def lttb_indices(x, y, max_points=MAX_TREND_POINTS):
+    """Positions of at most max_points points that preserve a line's visual shape (Largest-Triangle-Three-Buckets)"""
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    x = pd.Series(x)
+    x = (x.astype("int64") if pd.api.types.is_datetime64_any_dtype(x) else pd.to_numeric(x)).to_numpy(dtype=float)
+    y = pd.to_numeric(pd.Series(y)).to_numpy(dtype=float)
+
+    # First and last points are always kept; the rest are split into equal buckets, one point picked per bucket
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    selected = np.empty(max_points, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+        # Keep the point forming the largest triangle with the previously kept point and the next bucket's average
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(areas.argmax())
+        selected[i + 1] = previous
+    return selected
+
+# Figures are cached as resources, so a rerun with unchanged data reuses the already built figure object
+@st.cache_resource(max_entries=16, show_spinner=False)
+def build_radar_figure(metrics):
+    """Build the RAGAS radar chart from (metric name, score) pairs"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=[score for _, score in metrics],
+        theta=[name for name, _ in metrics],
+        fill='toself',
+        name='RAGAS Metrics'
+    ))
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(visible=True, range=[0, 1])
+        ),
+        showlegend=True
+    )
+    return fig
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def build_success_rate_figure(df_runs):
+    """Build the success rate trend line from runs with started_at and success_rate columns"""
+    return px.line(
+        df_runs,
+        x='started_at',
+        y='success_rate',
+        title="Success Rate Trend",
+        labels={'success_rate': 'Success Rate (%)', 'started_at': 'Time'},
+        render_mode='webgl'
+    )
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def build_agent1_trends_figure(trends_df):
+    """Build the Agent 1 quality trend lines from completed runs sorted by started_at"""
+    # Traces are plain dicts validated in one pass by the Figure constructor, downsampled once
+    # the run history outgrows MAX_TREND_POINTS
+    traces = []
+    for column, name in AGENT1_TREND_METRICS.items():
+        points = trends_df[["started_at", column]].dropna()
+        points = points.iloc[lttb_indices(points["started_at"], points[column])]
+        traces.append(dict(
+            type="scattergl",
+            x=points["started_at"],
+            y=points[column],
+            name=name,
+            mode="lines+markers"
+        ))
+
+    return go.Figure(
+        data=traces,
+        layout=dict(
+            xaxis_title="Date",
+            yaxis_title="Score",
+            yaxis=dict(range=[0, 1]),
+            hovermode="x unified"
+        )
+    )
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def build_trends_figure(df_trends, metrics_to_plot):
+    """Build the RAGAS metrics trend lines, one trace per metric with data"""
+    # Long form lets plotly express group all metrics into traces in a single pass
+    df_long = df_trends.melt(
+        id_vars='date',
+        value_vars=list(metrics_to_plot),
+        var_name='metric',
+        value_name='score'
+    ).dropna(subset=['score'])
+    if len(df_long) > MAX_TREND_POINTS:
+        df_long = pd.concat([
+            points.iloc[lttb_indices(points['date'], points['score'])]
+            for _, points in df_long.groupby('metric', sort=False)
+        ])
+    df_long['metric'] = df_long['metric'].map(metrics_to_plot)
+
+    # WebGL traces are drawn on the GPU instead of as one SVG node per point
+    fig = px.line(df_long, x='date', y='score', color='metric', markers=True, render_mode='webgl')
+    fig.update_traces(line=dict(width=3))
+    fig.update_layout(
+        title="RAGAS Metrics Trends Over Time",
+        xaxis_title="Date",
+        yaxis_title="Score",
+        yaxis=dict(range=[0, 1]),
+        hovermode='x unified',
+        legend_title_text=None
+    )
+    return fig
+
+# Largest number of queries for which the score distribution shows every individual score
+BOX_ALL_POINTS_MAX = 200
+# Above this many queries, only each metric's box statistics are sent to the browser
+BOX_SUMMARY_MIN = 500
+
+def score_label(column):
+    """Display name of a RAGAS score column"""
+    return column.replace('_score', '').replace('_', ' ').title()
+
+def build_summary_boxes(scores_df):
+    """Build box plots from precomputed quartiles and whisker fences, so the figure size doesn't grow with the run"""
+    fig = go.Figure()
+    # One null mask for all metrics, applied to plain numpy columns
+    values = scores_df.to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    for i, column in enumerate(scores_df.columns):
+        scores = values[present[:, i], i]
+        if scores.size == 0:
+            continue
+        q1, median, q3 = np.quantile(scores, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        # Whiskers reach the furthest scores within 1.5 IQR of the box, as plotly computes them
+        within = scores[(scores >= q1 - 1.5 * iqr) & (scores <= q3 + 1.5 * iqr)]
+        label = score_label(column)
+        fig.add_trace(go.Box(
+            x=[label],
+            q1=[q1],
+            median=[median],
+            q3=[q3],
+            lowerfence=[within.min()],
+            upperfence=[within.max()],
+            mean=[scores.mean()],
+            name=label
+        ))
+    return fig
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def build_score_distribution_figure(scores_df):
+    """Build the per-metric score box plots from a frame with one column per RAGAS score"""
+    if len(scores_df) > BOX_SUMMARY_MIN:
+        fig = build_summary_boxes(scores_df)
+    else:
+        # One long frame feeds every box in a single plotly express call; metrics without scores drop out
+        df_long = scores_df.melt(var_name='metric', value_name='score').dropna(subset=['score'])
+        df_long['metric'] = df_long['metric'].map(score_label)
+
+        # Every point is embedded in the figure, so larger runs only show the outliers next to each box
+        points = 'all' if len(scores_df) <= BOX_ALL_POINTS_MAX else 'outliers'
+        fig = px.box(df_long, x='metric', y='score', color='metric', points=points)
+    fig.update_layout(
+        title="Score Distribution Across Queries",
+        xaxis_title=None,
+        yaxis_title="Score (0-1)",
+        yaxis=dict(range=[0, 1]),
+        legend_title_text=None
+    )
+    return fig
+
+# Result fields the run details use; the large retrieved_context column is never requested
+RESULT_COLUMNS = [
+    'query_id', 'query_text', 'generated_answer', 'reference_answer',
+    'faithfulness_score', 'answer_relevance_score', 'context_precision_score', 'context_recall_score',
+    'response_time_ms', 'token_count', 'evaluation_status', 'error_message'
+]
+
+RAW_RESULT_COLUMNS = [
+    'query_id', 'query_text', 'evaluation_status',
+    'faithfulness_score', 'answer_relevance_score', 'context_precision_score', 'context_recall_score',
+    'response_time_ms', 'error_message'
+]
+
+RESULTS_ENDPOINT = "/api/v1/evaluation/runs/{run_id}/results?fields=" + ",".join(RESULT_COLUMNS)
+
+# What each RAGAS score measures, in the order the query details show them
+SCORE_CAPTIONS = {
+    'faithfulness_score': "How factually accurate is the answer based on the retrieved context?",
+    'answer_relevance_score': "How well does the answer address the original question?",
+    'context_precision_score': "How much of the retrieved context is relevant to the question?",
+    'context_recall_score': "How much of the relevant information was retrieved?"
+}
+
+def results_to_frame(results):
+    """Build a run's results frame with numeric score and timing columns"""
+    results_df = pd.DataFrame(results, columns=RESULT_COLUMNS)
+    for column in ('response_time_ms', 'token_count'):
+        results_df[column] = pd.to_numeric(results_df[column], errors='coerce', downcast='integer')
+    # Scores stay float64: float32 turns 0.7 into 0.699999988, which lands below the score band thresholds
+    for metric in SCORE_BANDS:
+        results_df[metric] = pd.to_numeric(results_df[metric], errors='coerce')
+    return results_df
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def load_results(run_id):
+    """Results frame of a finished run, which never changes, so it is built once and kept for an hour"""
+    # Fetched fresh rather than through fetch_json, which may still hold a partial payload from while the run was going
+    return results_to_frame(get_json(RESULTS_ENDPOINT.format(run_id=run_id)))
+
+# Widgets that live in Agent 2 views which are not rendered on every run
+VIEW_WIDGET_KEYS = ("trends_days_range", "runs_type_filter", "runs_selected_run", "runs_query_page", "runs_selected_query")
+# Number of queries offered at once in the run details' query selector
+QUERY_PAGE_SIZE = 10
+
+def reset_query_selection():
+    """Start the query selector of a newly selected run from its first page"""
+    st.session_state.pop("runs_query_page", None)
+    st.session_state.pop("runs_selected_query", None)
+
+def keep_view_widget_state():
+    """Keep the selections of widgets in hidden views, which Streamlit would otherwise discard"""
+    for key in VIEW_WIDGET_KEYS:
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
 
 def show_agent1_metrics():
     """Display Agent 1 (OCR) evaluation metrics"""
     st.header("🧾 Agent 1 (OCR) Evaluation Metrics")
 
+    # Fetch the summary and the recent runs concurrently; each is collected where it is used
+    prefetched = prefetch_data("/api/v1/metrics/agent1/summary", "/api/v1/metrics/agent1/runs?limit=10")
+
     # Fetch Agent 1 summary metrics
-    agent1_summary = fetch_data("/api/v1/metrics/agent1/summary")
+    agent1_summary = fetch_data("/api/v1/metrics/agent1/summary", prefetched["/api/v1/metrics/agent1/summary"])
 
     if agent1_summary:
         # Display summary metrics
@@ -194,56 +496,37 @@ def show_agent1_metrics():
         # Detailed metrics section
         st.subheader("📈 Detailed Metrics")
 
-        metric_col1, metric_col2, metric_col3 = st.columns(3)
-
-        with metric_col1:
-            st.write("**Exact Match Metrics**")
-            date_match = agent1_summary.get("avg_date_match", 0)
-            st.metric("📅 Date Match", f"{date_match:.1%}")
-            st.metric("🏪 Merchant Match", f"{merchant_match:.1%}")
-            st.metric("💰 Amount Match", f"{amount_match:.1%}")
-
-        with metric_col2:
-            st.write("**Item Extraction Metrics**")
-            item_precision = agent1_summary.get("avg_item_precision", 0)
-            item_recall = agent1_summary.get("avg_item_recall", 0)
-            item_f1 = agent1_summary.get("avg_item_f1", 0)
-            st.metric("🎯 Precision", f"{item_precision:.1%}")
-            st.metric("📚 Recall", f"{item_recall:.1%}")
-            st.metric("⚖️ F1 Score", f"{item_f1:.1%}")
-
-        with metric_col3:
-            st.write("**LLM-as-a-Judge**")
-            merchant_sim = agent1_summary.get("avg_merchant_similarity", 0)
-            items_sim = agent1_summary.get("avg_items_similarity", 0)
-            st.metric("🔤 Merchant Similarity", f"{merchant_sim:.1%}")
-            st.metric("📝 Items Similarity", f"{items_sim:.1%}")
-            st.metric("⭐ Overall Quality", f"{overall_quality:.1%}")
+        # One table instead of nine metric widgets, each of which is a separate element to send
+        detailed_metrics = pd.DataFrame(
+            [
+                (category, label, agent1_summary.get(key, 0) * 100)
+                for category, label, key in AGENT1_DETAILED_METRICS
+            ],
+            columns=["Category", "Metric", "Score"]
+        )
+        st.dataframe(
+            detailed_metrics,
+            column_config={"Score": st.column_config.NumberColumn(format="%.1f%%")},
+            use_container_width=True,
+            hide_index=True
+        )
 
         st.markdown("---")
 
         # Recent runs section
         st.subheader("🏃 Recent Evaluation Runs")
-        agent1_runs = fetch_data("/api/v1/metrics/agent1/runs?limit=10")
+        agent1_runs = fetch_data("/api/v1/metrics/agent1/runs?limit=10", prefetched["/api/v1/metrics/agent1/runs?limit=10"])
 
         if agent1_runs and len(agent1_runs) > 0:
-            runs_df = pd.DataFrame(agent1_runs)
-
-            # Format the dataframe for display
-            display_df = pd.DataFrame({
-                "Run ID": runs_df["run_id"].apply(lambda x: str(x)[:8]),
-                "Type": runs_df["run_type"],
-                "Status": runs_df["status"],
-                "Started": runs_df["started_at"].apply(format_timestamp),
-                "Tickets": runs_df["total_tickets"],
-                "Success": runs_df["successful_tickets"],
-                "Merchant Match": runs_df["average_merchant_match"].apply(lambda x: f"{x:.1%}" if pd.notna(x) else "N/A"),
-                "Amount Match": runs_df["average_amount_match"].apply(lambda x: f"{x:.1%}" if pd.notna(x) else "N/A"),
-                "F1 Score": runs_df["average_item_f1"].apply(lambda x: f"{x:.1%}" if pd.notna(x) else "N/A"),
-                "Overall Quality": runs_df["average_overall_quality"].apply(lambda x: f"{x:.1%}" if pd.notna(x) else "N/A")
-            })
-
-            st.dataframe(display_df, use_container_width=True)
+            runs_df = agent1_runs_to_frame(agent1_runs)
+
+            # Values stay numeric and the grid formats only the rows it draws
+            st.dataframe(
+                runs_df[list(AGENT1_RUN_COLUMN_CONFIG)],
+                column_config=AGENT1_RUN_COLUMN_CONFIG,
+                use_container_width=True,
+                hide_index=True
+            )
         else:
             st.info("No Agent 1 evaluation runs found yet. Evaluate tickets from the Admin Dashboard to see metrics here.")
 
@@ -251,52 +534,13 @@ def show_agent1_metrics():
         st.subheader("📊 Quality Trends Over Time")
 
         if agent1_runs and len(agent1_runs) > 0:
-            # Filter completed runs with metrics
-            completed_runs = [r for r in agent1_runs if r.get("status") == "completed" and r.get("average_overall_quality") is not None]
-
-            if len(completed_runs) > 0:
-                trends_df = pd.DataFrame(completed_runs)
-                trends_df["started_at"] = pd.to_datetime(trends_df["started_at"])
-                trends_df = trends_df.sort_values("started_at")
-
-                fig = go.Figure()
-
-                # Add traces for each metric
-                fig.add_trace(go.Scatter(
-                    x=trends_df["started_at"],
-                    y=trends_df["average_overall_quality"],
-                    name="Overall Quality",
-                    mode="lines+markers"
-                ))
-
-                fig.add_trace(go.Scatter(
-                    x=trends_df["started_at"],
-                    y=trends_df["average_merchant_match"],
-                    name="Merchant Match",
-                    mode="lines+markers"
-                ))
-
-                fig.add_trace(go.Scatter(
-                    x=trends_df["started_at"],
-                    y=trends_df["average_amount_match"],
-                    name="Amount Match",
-                    mode="lines+markers"
-                ))
-
-                fig.add_trace(go.Scatter(
-                    x=trends_df["started_at"],
-                    y=trends_df["average_item_f1"],
-                    name="Item F1 Score",
-                    mode="lines+markers"
-                ))
-
-                fig.update_layout(
-                    xaxis_title="Date",
-                    yaxis_title="Score",
-                    yaxis=dict(range=[0, 1]),
-                    hovermode="x unified"
-                )
+            # Filter completed runs with metrics from the runs frame, whose start times are already parsed
+            completed_mask = (runs_df["status"] == "completed") & runs_df["average_overall_quality"].notna()
 
+            if completed_mask.any():
+                trends_df = runs_df.loc[completed_mask].sort_values("started_at")
+
+                fig = build_agent1_trends_figure(trends_df[["started_at", *AGENT1_TREND_METRICS]])
                 st.plotly_chart(fig, use_container_width=True)
             else:
                 st.info("Not enough completed evaluations to show trends yet.")
@@ -305,84 +549,14 @@ def show_agent1_metrics():
     else:
         st.warning("Failed to fetch Agent 1 metrics from evaluation service.")
 
-def main():
-    st.title("📊 Metrics Dashboard")
-    st.markdown("Monitor and analyze system performance metrics")
-
-    # Add tabs for different agent evaluations
-    metric_category = st.selectbox(
-        "📈 Metric Category:",
-        ["Agent 1 (OCR)", "Agent 2 (RAG)"],
-        help="Select which agent evaluation to view"
-    )
-
-    st.markdown("---")
-
-    # Sidebar for controls
-    st.sidebar.header("📊 Controls")
-
-    # Auto-refresh toggle
-    auto_refresh = st.sidebar.checkbox("Auto-refresh (30s)", value=False)
-
-    if auto_refresh:
-        # Auto-refresh every 30 seconds
-        import time
-        time.sleep(30)
-        st.rerun()
-
-    # Manual refresh button
-    if st.sidebar.button("🔄 Refresh Data"):
-        st.rerun()
-
-    # === AGENT 1 (OCR) METRICS ===
-    if metric_category == "Agent 1 (OCR)":
-        show_agent1_metrics()
-        return
-
-    # === AGENT 2 (RAG) METRICS ===
-    # Trigger evaluation section
-    st.sidebar.header("🎯 Trigger Evaluation")
-
-    eval_type = st.sidebar.selectbox(
-        "Evaluation Type:",
-        ["sample", "full"],
-        help="**Sample:** Test with a subset of queries from the test dataset for quick validation\n**Full:** Evaluate all 45 queries from the test dataset (takes ~5-10 minutes)"
-    )
-
-    sample_size = 5
-    if eval_type == "sample":
-        sample_size = st.sidebar.slider(
-            "Number of Queries to Evaluate:",
-            min_value=1,
-            max_value=10,
-            value=5,
-            help="Randomly select this many queries from the test dataset"
-        )
-        st.sidebar.caption(f"⚡ Quick test with {sample_size} queries - completes in ~1-2 minutes")
-    else:
-        st.sidebar.caption("🔄 Full evaluation of all 45 test queries - takes ~5-10 minutes")
-
-    if st.sidebar.button("▶️ Start Evaluation"):
-        with st.spinner("Triggering evaluation..."):
-            result = trigger_evaluation(eval_type, sample_size)
-            if result:
-                st.sidebar.success(f"✅ {result['message']}")
-                st.sidebar.info("⏳ Evaluation is running in the background. Refresh this page in a few minutes to see results.")
-            else:
-                st.sidebar.error("❌ Failed to start evaluation")
-
-    # Check for running evaluations
-    runs_data = fetch_data("/api/v1/evaluation/runs?limit=10")
-    if runs_data:
-        running_runs = [run for run in runs_data if run.get('status') == 'running']
-        if running_runs:
-            st.info(f"🔄 **{len(running_runs)} evaluation(s) currently running.** Results will appear below when complete. Use the refresh button to check for updates.")
-
+def show_agent2_summary(prefetched):
+    """Display Agent 2 (RAG) summary cards and operational token consumption, collecting main()'s prefetches on the first run"""
     # Main dashboard content
     col1, col2, col3, col4 = st.columns(4)
 
     # Fetch summary metrics
-    summary_data = fetch_data("/api/v1/metrics/summary")
+    # Prefetches are popped so auto-refresh reruns of this fragment fetch again
+    summary_data = fetch_data("/api/v1/metrics/summary", prefetched.pop("/api/v1/metrics/summary", None))
 
     if summary_data:
         # Key metrics cards
@@ -437,7 +611,10 @@ def main():
     st.caption("Live token usage from actual user queries (not evaluation)")
 
     # Fetch operational metrics
-    operational_data = fetch_data("/api/v1/metrics/agent2/operational?days=30")
+    operational_data = fetch_data(
+        "/api/v1/metrics/agent2/operational?days=30",
+        prefetched.pop("/api/v1/metrics/agent2/operational?days=30", None)
+    )
 
     if operational_data:
         token_col1, token_col2, token_col3, token_col4 = st.columns(4)
@@ -464,87 +641,241 @@ def main():
     else:
         st.info("No operational query data available yet. Ask Agent 2 some questions to see metrics here!")
 
-    # Agent 2 RAG Evaluation metrics
-    st.markdown("---")
-    tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "📈 Trends", "🏃 Recent Runs", "⚙️ System Status"])
+def show_agent2_overview(prefetched):
+    """Display the Agent 2 (RAG) radar chart and success rate of recent runs"""
+    st.header("📊 Performance Overview")
 
-    with tab1:
-        st.header("📊 Performance Overview")
+    # Recent evaluation runs from main()'s prefetch, fetched again only on auto-refresh;
+    # a failed prefetch was already reported by main(), so it is neither retried nor reported twice
+    future = prefetched.pop("/api/v1/evaluation/runs?limit=10", None)
+    runs_data = None if future and future.exception() else fetch_data("/api/v1/evaluation/runs?limit=10", future)
+    if runs_data and len(runs_data) > 0:
+        runs_df = runs_to_frame(runs_data)
 
-        # Fetch recent evaluation runs
-        runs_data = fetch_data("/api/v1/evaluation/runs?limit=10")
+        # Create metrics visualization
+        col1, col2 = st.columns(2)
 
-        if runs_data and len(runs_data) > 0:
-            # Create metrics visualization
-            col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("🎯 RAGAS Metrics Distribution")
+
+            # Create a radar chart for the latest run with metrics
+            latest_run_with_metrics = None
+            for run in runs_data:
+                if any([
+                    run.get("average_faithfulness"),
+                    run.get("average_answer_relevance"),
+                    run.get("average_context_precision"),
+                    run.get("average_context_recall")
+                ]):
+                    latest_run_with_metrics = run
+                    break
+
+            if latest_run_with_metrics:
+                metrics = {
+                    'Faithfulness': latest_run_with_metrics.get("average_faithfulness", 0) or 0,
+                    'Answer Relevance': latest_run_with_metrics.get("average_answer_relevance", 0) or 0,
+                    'Context Precision': latest_run_with_metrics.get("average_context_precision", 0) or 0,
+                    'Context Recall': latest_run_with_metrics.get("average_context_recall", 0) or 0,
+                }
+
+                # Radar chart
+                st.plotly_chart(build_radar_figure(tuple(metrics.items())), use_container_width=True)
+            else:
+                st.info("No evaluation runs with RAGAS metrics available yet. Trigger an evaluation when agent-2-rag is running.")
 
-            with col1:
-                st.subheader("🎯 RAGAS Metrics Distribution")
-
-                # Create a radar chart for the latest run with metrics
-                latest_run_with_metrics = None
-                for run in runs_data:
-                    if any([
-                        run.get("average_faithfulness"),
-                        run.get("average_answer_relevance"),
-                        run.get("average_context_precision"),
-                        run.get("average_context_recall")
-                    ]):
-                        latest_run_with_metrics = run
-                        break
-
-                if latest_run_with_metrics:
-                    metrics = {
-                        'Faithfulness': latest_run_with_metrics.get("average_faithfulness", 0) or 0,
-                        'Answer Relevance': latest_run_with_metrics.get("average_answer_relevance", 0) or 0,
-                        'Context Precision': latest_run_with_metrics.get("average_context_precision", 0) or 0,
-                        'Context Recall': latest_run_with_metrics.get("average_context_recall", 0) or 0,
-                    }
-
-                    # Radar chart
-                    fig = go.Figure()
-                    fig.add_trace(go.Scatterpolar(
-                        r=list(metrics.values()),
-                        theta=list(metrics.keys()),
-                        fill='toself',
-                        name='RAGAS Metrics'
-                    ))
-                    fig.update_layout(
-                        polar=dict(
-                            radialaxis=dict(visible=True, range=[0, 1])
-                        ),
-                        showlegend=True
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("No evaluation runs with RAGAS metrics available yet. Trigger an evaluation when agent-2-rag is running.")
+        with col2:
+            st.subheader("📈 Success Rate Over Time")
 
-            with col2:
-                st.subheader("📈 Success Rate Over Time")
-
-                # Success rate over time
-                df_runs = pd.DataFrame(runs_data)
-                df_runs['started_at'] = pd.to_datetime(df_runs['started_at'])
-                df_runs['success_rate'] = (df_runs['successful_queries'] / df_runs['total_queries']).fillna(0) * 100
-                df_runs = df_runs.sort_values('started_at')
-
-                if len(df_runs) > 0:
-                    fig = px.line(
-                        df_runs,
-                        x='started_at',
-                        y='success_rate',
-                        title="Success Rate Trend",
-                        labels={'success_rate': 'Success Rate (%)', 'started_at': 'Time'}
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
+            # Success rate over time
+            df_runs = runs_df.sort_values('started_at')
+
+            if len(df_runs) > 0:
+                fig = build_success_rate_figure(df_runs[['started_at', 'success_rate']])
+                st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No evaluation runs found. Trigger your first evaluation!")
+
+SCHEDULER_STATUS_ENDPOINT = "/api/v1/evaluation/scheduler/status"
+# The service reports "healthy" or "unhealthy: <error>", so a substring test would match both
+HEALTHY_DB_STATUSES = frozenset({"healthy", "connected", "ok"})
+
+def show_system_status(auto_refresh):
+    """Display evaluation service health, scheduler status and dashboard configuration"""
+    st.header("⚙️ System Status")
+
+    if st.button("🔄 Refresh Status", help="Fetch the current health and scheduler status"):
+        fetch_status_json.clear()
+
+    # Health and scheduler checks are independent, so request both at once
+    status_futures = prefetch_data("/health", SCHEDULER_STATUS_ENDPOINT, fetch=fetch_status_json)
+    health_data = fetch_data("/health", status_futures["/health"])
+    scheduler_data = fetch_data(SCHEDULER_STATUS_ENDPOINT, status_futures[SCHEDULER_STATUS_ENDPOINT])
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("🏥 Service Health")
+        if health_data:
+            service_status, db_status, version = (
+                health_data.get("status", "unknown"),
+                health_data.get("database", "unknown"),
+                health_data.get("version", "N/A")
+            )
+            if service_status == "healthy":
+                st.success(f"✅ Service Status: {service_status}")
+            else:
+                st.warning(f"⚠️ Service Status: {service_status}")
+
+            if db_status in HEALTHY_DB_STATUSES:
+                st.success("✅ Database: Connected")
+            else:
+                st.error(f"❌ Database: {db_status}")
+
+            st.info(f"Version: {version}")
         else:
-            st.info("No evaluation runs found. Trigger your first evaluation!")
+            st.error("❌ Cannot connect to evaluation service")
+
+    with col2:
+        st.subheader("📅 Scheduler Status")
+        if scheduler_data:
+            scheduler_status, next_run, jobs = (
+                scheduler_data.get("status", "unknown"),
+                scheduler_data.get("next_run"),
+                scheduler_data.get("jobs", [])
+            )
+            if scheduler_status == "running":
+                st.success(f"✅ Scheduler: {scheduler_status}")
+            else:
+                st.warning(f"⚠️ Scheduler: {scheduler_status}")
+
+            if next_run:
+                st.info(f"⏰ Next Run: {format_timestamp(next_run)}")
+
+            st.info(f"📋 Active Jobs: {len(jobs)}")
+
+    # Configuration info
+    st.subheader("🔧 Configuration")
+    # The configuration block only changes with its inputs; the clock is a separate, small element
+    config_key = (EVALUATION_SERVICE_URL, auto_refresh)
+    if st.session_state.get("_config_key") != config_key:
+        st.session_state["_config_text"] = f"Evaluation Service URL: {EVALUATION_SERVICE_URL}\nAuto-refresh: {auto_refresh}"
+        st.session_state["_config_key"] = config_key
+    st.code(st.session_state["_config_text"])
+    st.caption(f"Current Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+def main():
+    st.title("📊 Metrics Dashboard")
+    st.markdown("Monitor and analyze system performance metrics")
+
+    # Add tabs for different agent evaluations
+    metric_category = st.selectbox(
+        "📈 Metric Category:",
+        ["Agent 1 (OCR)", "Agent 2 (RAG)"],
+        help="Select which agent evaluation to view"
+    )
+
+    st.markdown("---")
+
+    # Sidebar for controls
+    st.sidebar.header("📊 Controls")
+
+    # Auto-refresh toggle
+    auto_refresh = st.sidebar.checkbox(f"Auto-refresh ({REFRESH_SECONDS}s)", value=False)
+
+    # Auto-refresh re-runs only the metric sections instead of blocking and rerunning the page
+    refresh_interval = timedelta(seconds=REFRESH_SECONDS) if auto_refresh else None
+
+    # Manual refresh button; cached responses would otherwise be served again until they expire
+    if st.sidebar.button("🔄 Refresh Data"):
+        fetch_json.clear()
+        st.rerun()
+
+    # Finished-run results are kept for an hour even across refreshes; only this button drops them
+    if st.sidebar.button(
+        "🧹 Clear Cached Run Results",
+        help="Refresh the data and also discard the cached results of finished evaluation runs"
+    ):
+        fetch_json.clear()
+        load_results.clear()
+        st.rerun()
+
+    # === AGENT 1 (OCR) METRICS ===
+    if metric_category == "Agent 1 (OCR)":
+        st.fragment(run_every=refresh_interval)(show_agent1_metrics)()
+        return
+
+    # === AGENT 2 (RAG) METRICS ===
+    keep_view_widget_state()
+
+    # Trigger evaluation section
+    st.sidebar.header("🎯 Trigger Evaluation")
+
+    eval_type = st.sidebar.selectbox(
+        "Evaluation Type:",
+        ["sample", "full"],
+        help="**Sample:** Test with a subset of queries from the test dataset for quick validation\n**Full:** Evaluate all 45 queries from the test dataset (takes ~5-10 minutes)"
+    )
+
+    sample_size = 5
+    if eval_type == "sample":
+        sample_size = st.sidebar.slider(
+            "Number of Queries to Evaluate:",
+            min_value=1,
+            max_value=10,
+            value=5,
+            help="Randomly select this many queries from the test dataset"
+        )
+        st.sidebar.caption(f"⚡ Quick test with {sample_size} queries - completes in ~1-2 minutes")
+    else:
+        st.sidebar.caption("🔄 Full evaluation of all 45 test queries - takes ~5-10 minutes")
+
+    if st.sidebar.button("▶️ Start Evaluation"):
+        with st.spinner("Triggering evaluation..."):
+            result = trigger_evaluation(eval_type, sample_size)
+            if result:
+                st.sidebar.success(f"✅ {result['message']}")
+                st.sidebar.info("⏳ Evaluation is running in the background. Refresh this page in a few minutes to see results.")
+            else:
+                st.sidebar.error("❌ Failed to start evaluation")
+
+    # Fetch the independent endpoints of this page concurrently; each is collected where it is used,
+    # so a failed prefetch is reported once instead of being fetched again with retries
+    prefetched = prefetch_data(
+        "/api/v1/evaluation/runs?limit=10",
+        "/api/v1/metrics/summary",
+        "/api/v1/metrics/agent2/operational?days=30"
+    )
+
+    # Check for running evaluations
+    runs_data = fetch_data("/api/v1/evaluation/runs?limit=10", prefetched["/api/v1/evaluation/runs?limit=10"])
+    runs_df = runs_to_frame(runs_data) if runs_data else pd.DataFrame()
+    if not runs_df.empty:
+        running_runs = runs_df[runs_df['status'] == 'running']
+        if len(running_runs) > 0:
+            st.info(f"🔄 **{len(running_runs)} evaluation(s) currently running.** Results will appear below when complete. Use the refresh button to check for updates.")
+
+    # Summary cards re-run on their own when auto-refresh is on
+    st.fragment(run_every=refresh_interval)(show_agent2_summary)(prefetched)
 
-    with tab2:
+    # Agent 2 RAG Evaluation metrics
+    st.markdown("---")
+    # Only the selected view is executed, so hidden views don't fetch data or build figures
+    active_view = st.radio(
+        "View:",
+        ["📊 Overview", "📈 Trends", "🏃 Recent Runs", "⚙️ System Status"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="agent2_view"
+    )
+
+    if active_view == "📊 Overview":
+        st.fragment(run_every=refresh_interval)(show_agent2_overview)(prefetched)
+
+    elif active_view == "📈 Trends":
         st.header("📈 Historical Trends")
 
         # Fetch trends data
-        days_range = st.selectbox("Time Range:", [7, 14, 30], index=0)
+        days_range = st.selectbox("Time Range:", [7, 14, 30], index=0, key="trends_days_range")
         trends_data = fetch_data(f"/api/v1/metrics/trends?days={days_range}")
 
         if trends_data and trends_data.get("data_points"):
@@ -552,36 +883,18 @@ def main():
             df_trends['date'] = pd.to_datetime(df_trends['date'])
             df_trends = df_trends.sort_values('date')
 
-            # Multi-line chart for all RAGAS metrics
-            fig = go.Figure()
-
             metrics_to_plot = {
                 'faithfulness': '🎯 Faithfulness',
                 'answer_relevance': '🔍 Answer Relevance',
                 'context_precision': '📍 Context Precision',
                 'context_recall': '📚 Context Recall'
             }
+            # Only metrics with at least one value in the window get a trend line and summary stats
+            has_data = df_trends[list(metrics_to_plot)].notna().any()
+            metrics_to_plot = {metric: name for metric, name in metrics_to_plot.items() if has_data[metric]}
 
-            for metric, display_name in metrics_to_plot.items():
-                # Filter out null values
-                metric_data = df_trends[df_trends[metric].notna()]
-                if len(metric_data) > 0:
-                    fig.add_trace(go.Scatter(
-                        x=metric_data['date'],
-                        y=metric_data[metric],
-                        mode='lines+markers',
-                        name=display_name,
-                        line=dict(width=3)
-                    ))
-
-            fig.update_layout(
-                title="RAGAS Metrics Trends Over Time",
-                xaxis_title="Date",
-                yaxis_title="Score",
-                yaxis=dict(range=[0, 1]),
-                hovermode='x unified'
-            )
-
+            # Multi-line chart for all RAGAS metrics
+            fig = build_trends_figure(df_trends[['date', *metrics_to_plot]], metrics_to_plot)
             st.plotly_chart(fig, use_container_width=True)
 
             # Summary statistics
@@ -590,16 +903,12 @@ def main():
             with col1:
                 st.subheader("📊 Summary Statistics")
                 for metric, display_name in metrics_to_plot.items():
-                    avg_score = df_trends[metric].mean()
-                    if not pd.isna(avg_score):
-                        st.metric(f"Avg {display_name}", f"{avg_score:.3f}")
+                    st.metric(f"Avg {display_name}", f"{df_trends[metric].mean():.3f}")
 
             with col2:
                 st.subheader("📈 Best Performance")
                 for metric, display_name in metrics_to_plot.items():
-                    max_score = df_trends[metric].max()
-                    if not pd.isna(max_score):
-                        st.metric(f"Max {display_name}", f"{max_score:.3f}")
+                    st.metric(f"Max {display_name}", f"{df_trends[metric].max():.3f}")
 
             with col3:
                 st.subheader("🔄 Total Evaluations")
@@ -608,65 +917,73 @@ def main():
         else:
             st.info("No trend data available yet. Run more evaluations to see trends!")
 
-    with tab3:
+    elif active_view == "🏃 Recent Runs":
         st.header("🏃 Recent Evaluation Runs")
 
         # Add filter for run types
+        st.session_state.setdefault("runs_type_filter", ["sample", "manual", "realtime"])
         run_type_filter = st.multiselect(
             "Filter by Type:",
             options=["sample", "manual", "realtime"],
-            default=["sample", "manual", "realtime"],
-            help="Filter evaluation runs by type"
+            help="Filter evaluation runs by type",
+            key="runs_type_filter"
         )
 
-        if runs_data:
+        if not runs_df.empty:
             # Filter runs based on selection
-            filtered_runs = [run for run in runs_data if run.get('run_type') in run_type_filter]
+            filtered_runs_df = runs_df[runs_df['run_type'].isin(run_type_filter)]
         else:
-            filtered_runs = []
-
-        if filtered_runs:
-            # Create a detailed table of recent runs
-            runs_df = pd.DataFrame(filtered_runs)
+            filtered_runs_df = runs_df
 
-            # Format the DataFrame for display
-            display_df = runs_df.copy()
-            display_df['started_at'] = display_df['started_at'].apply(format_timestamp)
-            display_df['completed_at'] = display_df['completed_at'].apply(format_timestamp)
-
-            # Round numeric columns
+        if not filtered_runs_df.empty:
+            # Score columns stay numeric and are rounded by the grid
             numeric_cols = ['average_faithfulness', 'average_answer_relevance',
                           'average_context_precision', 'average_context_recall']
-            for col in numeric_cols:
-                if col in display_df.columns:
-                    display_df[col] = display_df[col].apply(
-                        lambda x: f"{x:.3f}" if x is not None else "N/A"
-                    )
 
             # Display the table
+            # Timestamps were formatted once when the runs frame was built
             st.dataframe(
-                display_df[[
+                filtered_runs_df[[
                     'run_type', 'status', 'total_queries', 'successful_queries',
-                    'average_faithfulness', 'average_answer_relevance',
-                    'average_context_precision', 'average_context_recall',
-                    'started_at', 'completed_at'
+                    *numeric_cols,
+                    '_started_fmt', '_completed_fmt'
                 ]],
+                column_config={
+                    **score_column_config(numeric_cols),
+                    '_started_fmt': 'started_at',
+                    '_completed_fmt': 'completed_at'
+                },
                 use_container_width=True
             )
 
             # Detailed view of selected run
-            if len(filtered_runs) > 0:
+            if len(filtered_runs_df) > 0:
                 st.subheader("🔍 Run Details")
+                run_ids = filtered_runs_df['run_id'].tolist()
+                run_types = dict(zip(filtered_runs_df['run_id'], filtered_runs_df['run_type']))
+                run_statuses = dict(zip(filtered_runs_df['run_id'], filtered_runs_df['status']))
+                # Forget a kept selection that the current filter no longer shows
+                if st.session_state.get("runs_selected_run") not in run_ids:
+                    st.session_state.pop("runs_selected_run", None)
                 selected_run_id = st.selectbox(
                     "Select run for detailed results:",
-                    options=[run['run_id'] for run in filtered_runs],
-                    format_func=lambda x: f"{x[:8]}... ({next(r['run_type'] for r in filtered_runs if r['run_id'] == x)})"
+                    options=run_ids,
+                    format_func=lambda x: f"{x[:8]}... ({run_types[x]})",
+                    key="runs_selected_run",
+                    on_change=reset_query_selection
                 )
 
                 if selected_run_id:
-                    detailed_results = fetch_data(f"/api/v1/evaluation/runs/{selected_run_id}/results")
-                    if detailed_results:
-                        results_df = pd.DataFrame(detailed_results)
+                    try:
+                        # A running run is still gaining results, so only its short-lived response cache applies
+                        if run_statuses[selected_run_id] == 'running':
+                            results_df = results_to_frame(fetch_json(RESULTS_ENDPOINT.format(run_id=selected_run_id)))
+                        else:
+                            results_df = load_results(selected_run_id)
+                    except requests.exceptions.RequestException as e:
+                        st.error(f"Failed to fetch results for run {selected_run_id[:8]}: {str(e)}")
+                        results_df = pd.DataFrame()
+                    if not results_df.empty:
 
                         # Show summary
                         col1, col2, col3, col4 = st.columns(4)
@@ -686,35 +1003,39 @@ def main():
                         st.subheader("📋 Query Analysis")
 
                         # Filter successful queries for detailed analysis
-                        successful_queries = results_df[results_df['evaluation_status'] == 'success'].copy()
+                        successful_queries = results_df[results_df['evaluation_status'] == 'success']
 
                         if len(successful_queries) > 0:
-                            # Score interpretation helper
-                            def interpret_score(score, metric_name):
-                                if score is None or pd.isna(score):
-                                    return "❓ N/A", "gray"
-                                score = float(score)
-                                if metric_name in ['faithfulness_score', 'answer_relevance_score']:
-                                    if score >= 0.8: return f"🟢 Excellent ({score:.3f})", "green"
-                                    elif score >= 0.6: return f"🟡 Good ({score:.3f})", "orange"
-                                    elif score >= 0.4: return f"🟠 Fair ({score:.3f})", "orange"
-                                    else: return f"🔴 Poor ({score:.3f})", "red"
-                                else:  # precision/recall metrics
-                                    if score >= 0.7: return f"🟢 High ({score:.3f})", "green"
-                                    elif score >= 0.5: return f"🟡 Medium ({score:.3f})", "orange"
-                                    elif score >= 0.3: return f"🟠 Low ({score:.3f})", "orange"
-                                    else: return f"🔴 Very Low ({score:.3f})", "red"
-
-                            # Query selection for detailed view
+                            # Query selection for detailed view, one page of queries at a time
                             if len(successful_queries) > 0:
+                                page_count = math.ceil(len(successful_queries) / QUERY_PAGE_SIZE)
+                                if st.session_state.get("runs_query_page", 1) > page_count:
+                                    st.session_state.pop("runs_query_page", None)
+                                page = 1
+                                if page_count > 1:
+                                    page = st.number_input(
+                                        f"Query page (of {page_count})",
+                                        min_value=1,
+                                        max_value=page_count,
+                                        step=1,
+                                        key="runs_query_page"
+                                    )
+                                page_start = (page - 1) * QUERY_PAGE_SIZE
+                                page_texts = successful_queries['query_text'].iloc[page_start:page_start + QUERY_PAGE_SIZE].tolist()
+                                page_indices = range(page_start, page_start + len(page_texts))
+
+                                if st.session_state.get("runs_selected_query") not in page_indices:
+                                    st.session_state.pop("runs_selected_query", None)
                                 selected_query_idx = st.selectbox(
                                     "🔍 Select a query for detailed analysis:",
-                                    range(len(successful_queries)),
-                                    format_func=lambda x: f"Query {x+1}: {successful_queries.iloc[x]['query_text'][:50]}{'...' if len(successful_queries.iloc[x]['query_text']) > 50 else ''}"
+                                    page_indices,
+                                    format_func=lambda x: f"Query {x+1}: {page_texts[x - page_start][:50]}{'...' if len(page_texts[x - page_start]) > 50 else ''}",
+                                    key="runs_selected_query"
                                 )
 
                                 if selected_query_idx is not None:
-                                    query_row = successful_queries.iloc[selected_query_idx]
+                                    # A one-row itertuples reads fields by attribute, without boxing the mixed-type row into an object Series
+                                    query_row = next(successful_queries.iloc[[selected_query_idx]].itertuples(index=False))
 
                                     # Display selected query details
                                     st.markdown("### 🎯 Query Analysis Details")
@@ -723,83 +1044,63 @@ def main():
 
                                     with col1:
                                         st.markdown("**📝 Original Query:**")
-                                        st.info(query_row['query_text'])
+                                        st.info(query_row.query_text)
 
-                                        if query_row['generated_answer']:
+                                        if query_row.generated_answer:
                                             st.markdown("**🤖 Generated Answer:**")
-                                            st.text_area("", query_row['generated_answer'], height=150, disabled=True)
+                                            st.text_area("", query_row.generated_answer, height=150, disabled=True)
 
-                                        if query_row['reference_answer']:
+                                        if query_row.reference_answer:
                                             st.markdown("**✅ Reference Answer:**")
-                                            st.text_area("", query_row['reference_answer'], height=100, disabled=True)
+                                            st.text_area("", query_row.reference_answer, height=100, disabled=True)
 
                                     with col2:
                                         st.markdown("**📊 RAGAS Scores:**")
-
-                                        # Faithfulness
-                                        faith_text, faith_color = interpret_score(query_row['faithfulness_score'], 'faithfulness_score')
-                                        st.markdown(f"**Faithfulness:** {faith_text}")
-                                        st.caption("How factually accurate is the answer based on the retrieved context?")
-
-                                        # Answer Relevance
-                                        rel_text, rel_color = interpret_score(query_row['answer_relevance_score'], 'answer_relevance_score')
-                                        st.markdown(f"**Answer Relevance:** {rel_text}")
-                                        st.caption("How well does the answer address the original question?")
-
-                                        # Context Precision
-                                        prec_text, prec_color = interpret_score(query_row['context_precision_score'], 'context_precision_score')
-                                        st.markdown(f"**Context Precision:** {prec_text}")
-                                        st.caption("How much of the retrieved context is relevant to the question?")
-
-                                        # Context Recall
-                                        rec_text, rec_color = interpret_score(query_row['context_recall_score'], 'context_recall_score')
-                                        st.markdown(f"**Context Recall:** {rec_text}")
-                                        st.caption("How much of the relevant information was retrieved?")
+                                        # Rounded scores keep the memoized interpretations to a small set of keys
+                                        interpretations = [
+                                            (metric, interpret_score(round(float(getattr(query_row, metric)), 3), metric)[0])
+                                            for metric in SCORE_CAPTIONS
+                                        ]
+                                        for metric, score_text in interpretations:
+                                            st.markdown(f"**{score_label(metric)}:** {score_text}")
+                                            st.caption(SCORE_CAPTIONS[metric])
 
                                         # Performance metrics
                                         st.markdown("**⏱️ Performance:**")
-                                        st.metric("Response Time", f"{query_row['response_time_ms']}ms")
-                                        if query_row['token_count']:
-                                            st.metric("Tokens Used", f"{query_row['token_count']}")
+                                        st.metric("Response Time", f"{query_row.response_time_ms}ms")
+                                        if query_row.token_count:
+                                            st.metric("Tokens Used", f"{query_row.token_count}")
 
                         # Score distribution visualization
                         if len(successful_queries) > 1:
                             st.markdown("### 📊 Score Distribution Analysis")
 
-                            col1, col2 = st.columns(2)
+                            # Failed runs can leave every score empty; only metrics with scores are plotted
+                            means = successful_queries[list(SCORE_BANDS)].mean()
+                            score_cols = means.index[means.notna()].tolist()
 
-                            with col1:
-                                # Create score distribution chart
-                                score_cols = ['faithfulness_score', 'answer_relevance_score',
-                                            'context_precision_score', 'context_recall_score']
+                            if not score_cols:
+                                st.info("No score data to plot")
+                            else:
+                                scores_df = successful_queries[score_cols]
 
-                                fig = go.Figure()
+                                col1, col2 = st.columns(2)
 
-                                for col in score_cols:
-                                    scores = successful_queries[col].dropna()
-                                    if len(scores) > 0:
-                                        fig.add_trace(go.Box(
-                                            y=scores,
-                                            name=col.replace('_score', '').replace('_', ' ').title(),
-                                            boxpoints='all'
-                                        ))
-
-                                fig.update_layout(
-                                    title="Score Distribution Across Queries",
-                                    yaxis_title="Score (0-1)",
-                                    yaxis=dict(range=[0, 1])
-                                )
+                                with col1:
+                                    # Create score distribution chart
+                                    fig = build_score_distribution_figure(scores_df)
+                                    # A summary visual: rendering it static skips Plotly's hover and zoom handlers
+                                    st.plotly_chart(
+                                        fig,
+                                        use_container_width=True,
+                                        config={"staticPlot": True, "displayModeBar": False}
+                                    )
 
-                                st.plotly_chart(fig, use_container_width=True)
+                                with col2:
+                                    # Performance analysis
+                                    st.markdown("**🎯 Performance Summary:**")
 
-                            with col2:
-                                # Performance analysis
-                                st.markdown("**🎯 Performance Summary:**")
-
-                                for col in score_cols:
-                                    scores = successful_queries[col].dropna()
-                                    if len(scores) > 0:
-                                        avg_score = scores.mean()
+                                    for col, avg_score in means[score_cols].items():
                                         metric_name = col.replace('_score', '').replace('_', ' ').title()
 
                                         if avg_score >= 0.7:
@@ -809,72 +1110,21 @@ def main():
                                         else:
                                             st.error(f"🔴 {metric_name}: {avg_score:.3f} (Needs Improvement)")
 
-                        # Raw data table (collapsed by default)
-                        with st.expander("🗂️ View Raw Data Table"):
+                        # Raw data table (hidden by default); an expander would still build and send it on every run
+                        if st.toggle("🗂️ View Raw Data Table"):
                             st.dataframe(
-                                results_df[[
-                                    'query_id', 'query_text', 'evaluation_status',
-                                    'faithfulness_score', 'answer_relevance_score',
-                                    'context_precision_score', 'context_recall_score',
-                                    'response_time_ms', 'error_message'
-                                ]],
+                                results_df[RAW_RESULT_COLUMNS],
+                                column_config=score_column_config(SCORE_BANDS),
+                                height=400,
                                 use_container_width=True
                             )
         else:
             st.info("No evaluation runs available.")
 
-    with tab4:
-        st.header("⚙️ System Status")
-
-        # Health check
-        health_data = fetch_data("/health")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.subheader("🏥 Service Health")
-            if health_data:
-                service_status = health_data.get("status", "unknown")
-                if service_status == "healthy":
-                    st.success(f"✅ Service Status: {service_status}")
-                else:
-                    st.warning(f"⚠️ Service Status: {service_status}")
-
-                db_status = health_data.get("database", "unknown")
-                if "healthy" in str(db_status):
-                    st.success("✅ Database: Connected")
-                else:
-                    st.error(f"❌ Database: {db_status}")
-
-                st.info(f"Version: {health_data.get('version', 'N/A')}")
-            else:
-                st.error("❌ Cannot connect to evaluation service")
-
-        with col2:
-            st.subheader("📅 Scheduler Status")
-            scheduler_data = fetch_data("/api/v1/evaluation/scheduler/status")
-
-            if scheduler_data:
-                scheduler_status = scheduler_data.get("status", "unknown")
-                if scheduler_status == "running":
-                    st.success(f"✅ Scheduler: {scheduler_status}")
-                else:
-                    st.warning(f"⚠️ Scheduler: {scheduler_status}")
-
-                next_run = scheduler_data.get("next_run")
-                if next_run:
-                    st.info(f"⏰ Next Run: {format_timestamp(next_run)}")
-
-                jobs = scheduler_data.get("jobs", [])
-                st.info(f"📋 Active Jobs: {len(jobs)}")
-
-        # Configuration info
-        st.subheader("🔧 Configuration")
-        st.code(f"""
-Evaluation Service URL: {EVALUATION_SERVICE_URL}
-Auto-refresh: {auto_refresh}
-Current Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        """)
+    elif active_view == "⚙️ System Status":
+        # Status refreshes on its own, faster cadence without rerunning the rest of the page
+        status_interval = timedelta(seconds=STATUS_REFRESH_SECONDS) if auto_refresh else None
+        st.fragment(run_every=status_interval)(show_system_status)(auto_refresh)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
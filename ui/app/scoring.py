@@ -0,0 +1,30 @@
+"""
+RAGAS score interpretation shared by the UI pages.
+"""
+import math
+from bisect import bisect_right
+from functools import lru_cache
+
+
+# Interpretation bands per RAGAS score: lower bounds of each band above the lowest, and the band labels
+SCORE_BANDS = {
+    'faithfulness_score': ([0.4, 0.6, 0.8], ["🔴 Poor", "🟠 Fair", "🟡 Good", "🟢 Excellent"]),
+    'answer_relevance_score': ([0.4, 0.6, 0.8], ["🔴 Poor", "🟠 Fair", "🟡 Good", "🟢 Excellent"]),
+    'context_precision_score': ([0.3, 0.5, 0.7], ["🔴 Very Low", "🟠 Low", "🟡 Medium", "🟢 High"]),
+    'context_recall_score': ([0.3, 0.5, 0.7], ["🔴 Very Low", "🟠 Low", "🟡 Medium", "🟢 High"]),
+}
+BAND_COLORS = {
+    "🔴 Poor": "red", "🟠 Fair": "orange", "🟡 Good": "orange", "🟢 Excellent": "green",
+    "🔴 Very Low": "red", "🟠 Low": "orange", "🟡 Medium": "orange", "🟢 High": "green",
+}
+
+
+# Pages are re-executed on every rerun, so the cache lives here where it survives across reruns
+@lru_cache(maxsize=4096)
+def interpret_score(score, metric_name):
+    """Interpretation label and color of a RAGAS score, best called with the score rounded to 3 decimals"""
+    if math.isnan(score):
+        return "❓ N/A", "gray"
+    thresholds, bands = SCORE_BANDS[metric_name]
+    band = bands[bisect_right(thresholds, score)]
+    return f"{band} ({score:.3f})", BAND_COLORS[band]